@@ -21,6 +21,11 @@ from typing import Any, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from src.actions import click_element, click_position
 from src.screen import find_element, take_screenshot
 
@@ -57,8 +62,10 @@ class BaseGame(ABC):
         if not self.config_path.exists():
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
 
-        with open(self.config_path, "r") as f:
-            self.config = yaml.safe_load(f)
+        self.config = self._read_compiled_config()
+        if self.config is None:
+            with open(self.config_path, "r") as f:
+                self.config = yaml.load(f, Loader=_YamlLoader)
 
         game_cfg = self.config.get("game", {})
         self.game_name = game_cfg.get("name", "Unknown Game")
@@ -93,6 +100,36 @@ class BaseGame(ABC):
         logger.info(f"Asset dir: {self.asset_dir}")
         logger.info(f"Session duration: {self.session_duration} minutes")
 
+    def _read_compiled_config(self) -> Optional[dict]:
+        """
+        Load the ``<game>_config.py`` literal written by tools/capture.py.
+
+        The file is parsed as data with ast.literal_eval, never imported or
+        executed, so a config is still only ever read as data.  Returns None
+        when the companion is missing, malformed, or older than the YAML
+        (e.g. after a hand edit), so the caller falls back to YAML.
+        """
+        import ast
+
+        py_path = self.config_path.with_name(f"{self.config_path.stem}_config.py")
+        try:
+            if py_path.stat().st_mtime < self.config_path.stat().st_mtime:
+                return None
+            tree = ast.parse(py_path.read_text(encoding="utf-8"), filename=str(py_path))
+            (node,) = tree.body
+            if not (
+                isinstance(node, ast.Assign)
+                and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id == "CONFIG"
+            ):
+                raise ValueError("expected a single CONFIG = {...} assignment")
+            config = ast.literal_eval(node.value)
+        except Exception as e:
+            logger.debug(f"Compiled config unusable ({py_path}): {e}")
+            return None
+        return config if isinstance(config, dict) else None
+
     def _resolve_path(self, relative_path: str) -> Path:
         """Resolve a path relative to the project root (parent of config/)."""
         project_root = self.config_path.parent.parent.parent
@@ -1,13 +1,14 @@
 """
 Screen interaction layer: screenshot capture, image matching (OpenCV), and OCR (Tesseract).
 
-Handles macOS Retina display scaling automatically — Pillow captures at 2x resolution
-while PyAutoGUI operates at 1x logical coordinates.
+Handles macOS Retina display scaling automatically — screenshots are captured at 2x
+resolution while PyAutoGUI operates at 1x logical coordinates.
 """
 
 from __future__ import annotations
 
 import logging
+import os
 import time
 from pathlib import Path
 from typing import Optional
@@ -16,7 +17,6 @@ import cv2
 import numpy as np
 import pyautogui
 import pytesseract
-from PIL import Image
 
 logger = logging.getLogger(__name__)
 
@@ -28,66 +28,199 @@ if Path(_tesseract_path).exists():
     pytesseract.pytesseract.tesseract_cmd = _tesseract_path
 
 # macOS Retina displays capture at 2x resolution.
-# Detect scale factor once at import time.
+# Detected once per process by init_retina_scale().
 _RETINA_SCALE: int = 2
+_RETINA_SCALE_DETECTED: bool = False
+
+
+class ScreenGrabber:
+    """
+    Full-screen capture backed by a single, persistent MSS handle.
+
+    Opening an ``mss.mss()`` context sets up the display connection (and on
+    macOS the CoreGraphics capture state), so the handle is created once and
+    reused for every grab instead of per call.  Use :func:`get_grabber` to
+    get the shared instance; grabs must come from the thread that created it.
+
+    If MSS is not installed, grabs fall back to ``pyautogui.screenshot()``,
+    which works everywhere but is several times slower per frame.
+    """
+
+    def __init__(self, monitor_index: int = 1):
+        try:
+            import mss
+        except ImportError:
+            logger.warning("mss not installed — falling back to pyautogui.screenshot() (slower)")
+            self._sct = None
+            self._monitor = None
+            return
+
+        self._sct = mss.mss()
+        # monitors[0] is the union of all screens; [1] is the primary display
+        self._monitor = self._sct.monitors[monitor_index]
+
+    def _grab_raw(self) -> tuple[np.ndarray, int]:
+        """
+        Grab the primary screen without copying the pixels.
+
+        Returns the frame plus the cv2 colour code that turns it into BGR.
+        With MSS the frame is a ``np.frombuffer`` BGRA view over MSS's raw
+        buffer, so it is only valid until it is converted; callers convert
+        (and thereby copy) just the pixels they need.
+        """
+        if self._sct is None:
+            return np.asarray(pyautogui.screenshot()), cv2.COLOR_RGB2BGR
+        shot = self._sct.grab(self._monitor)
+        frame = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        return frame, cv2.COLOR_BGRA2BGR
+
+    def grab(self, reuse: bool = False) -> np.ndarray:
+        """
+        Grab the full primary screen as a BGR array in physical (Retina) pixels.
+
+        With reuse=True the frame is converted into a pooled buffer that the
+        next reusing grab overwrites, so only pass it for throwaway frames.
+        """
+        frame, code = self._grab_raw()
+        if reuse:
+            return cv2.cvtColor(frame, code, dst=_acquire(frame.shape[:2] + (3,)))
+        return cv2.cvtColor(frame, code)
+
+    def grab_region(self, bbox: tuple[int, int, int, int]) -> np.ndarray:
+        """
+        Grab the screen and return the (x1, y1, x2, y2) pixel box as BGR.
+
+        Only the box is colour-converted, so the rest of the frame is never
+        copied out of the capture buffer.
+        """
+        x1, y1, x2, y2 = bbox
+        frame, code = self._grab_raw()
+        return cv2.cvtColor(frame[y1:y2, x1:x2], code)
+
+
+# Reusable full-frame buffers keyed by shape; a 4K BGR frame is ~25 MiB, so
+# polling loops avoid a fresh allocation on every grab.
+_BUF_POOL: dict[tuple[int, ...], np.ndarray] = {}
+
+
+def _acquire(shape: tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+    """Return the pooled buffer for shape, allocating it on first use."""
+    buf = _BUF_POOL.get(shape)
+    if buf is None:
+        buf = _BUF_POOL[shape] = np.empty(shape, dtype)
+    return buf
+
+
+_grabber: Optional[ScreenGrabber] = None
+
+
+def get_grabber() -> ScreenGrabber:
+    """Return the process-wide ScreenGrabber, creating it on first use."""
+    global _grabber
+    if _grabber is None:
+        _grabber = ScreenGrabber()
+    return _grabber
 
 
 def _get_retina_scale() -> int:
-    """Detect Retina scale factor by comparing Pillow screenshot size to PyAutoGUI screen size."""
+    """Detect Retina scale factor by comparing the captured screenshot width to PyAutoGUI screen size."""
     try:
         screen_w, screen_h = pyautogui.size()
-        screenshot = pyautogui.screenshot()
-        pil_w, _ = screenshot.size
-        scale = pil_w // screen_w
+        capture_w = get_grabber().grab().shape[1]
+        scale = capture_w // screen_w
         return max(scale, 1)
     except Exception:
         return 2  # Default to 2x on macOS
 
 
 def init_retina_scale() -> int:
-    """Initialize the Retina scale factor. Call once at startup."""
-    global _RETINA_SCALE
+    """
+    Initialize the Retina scale factor.
+
+    Detection takes a full-screen screenshot, so it only runs on the first
+    call; later calls return the cached value.
+    """
+    global _RETINA_SCALE, _RETINA_SCALE_DETECTED
+    if _RETINA_SCALE_DETECTED:
+        return _RETINA_SCALE
     _RETINA_SCALE = _get_retina_scale()
+    _RETINA_SCALE_DETECTED = True
     logger.info(f"Retina scale factor: {_RETINA_SCALE}")
     return _RETINA_SCALE
 
 
-def take_screenshot(region: Optional[dict] = None) -> np.ndarray:
+def reset_retina_scale() -> None:
+    """
+    Forget the detected Retina scale and release the shared grabber.
+
+    Call init_retina_scale() again afterwards, e.g. once the game window has
+    moved to a monitor with a different scale.  Until then the scale stays at
+    the default of 2; take_screenshot() only recreates the grabber, it does
+    not re-detect the scale.
+    """
+    global _RETINA_SCALE, _RETINA_SCALE_DETECTED, _grabber
+    _RETINA_SCALE = 2
+    _RETINA_SCALE_DETECTED = False
+    if _grabber is not None and _grabber._sct is not None:
+        _grabber._sct.close()
+    _grabber = None
+
+
+def take_screenshot(region: Optional[dict] = None, reuse: bool = False) -> np.ndarray:
     """
     Capture the screen (or a region) and return as a BGR numpy array for OpenCV.
 
     Args:
         region: Optional dict with keys x, y, w, h in logical (PyAutoGUI) coordinates.
                 If None, captures the full screen.
+        reuse: Write a full-screen grab into a pooled buffer that the next
+               reusing call overwrites. Copy the result before keeping it.
 
     Returns:
         numpy array in BGR color format (OpenCV convention).
     """
+    grabber = get_grabber()
     if region:
-        # Convert logical coordinates to Pillow/retina pixel coordinates
-        pil_region = (
+        # Convert logical coordinates to retina pixel coordinates
+        pixel_box = (
             region["x"] * _RETINA_SCALE,
             region["y"] * _RETINA_SCALE,
             (region["x"] + region["w"]) * _RETINA_SCALE,
             (region["y"] + region["h"]) * _RETINA_SCALE,
         )
-        screenshot = pyautogui.screenshot()
-        screenshot = screenshot.crop(pil_region)
-    else:
-        screenshot = pyautogui.screenshot()
+        return grabber.grab_region(pixel_box)
+
+    return grabber.grab(reuse=reuse)
 
-    # Convert PIL Image to numpy BGR array for OpenCV
-    img_rgb = np.array(screenshot)
-    img_bgr = cv2.cvtColor(img_rgb, cv2.COLOR_RGB2BGR)
-    return img_bgr
 
+# Decoded templates keyed by (path, grayscale); entries are reused while the
+# file's mtime is unchanged, so a re-captured asset is picked up immediately.
+_TEMPLATE_CACHE: dict[tuple[str, bool], tuple[int, np.ndarray]] = {}
 
-def _load_template(template_path: str | Path) -> np.ndarray:
-    """Load a template image from disk as a BGR numpy array."""
+
+def _load_template(template_path: str | Path, grayscale: bool = False) -> np.ndarray:
+    """
+    Load a template image from disk as a BGR (or single-channel gray) numpy array.
+
+    Each file is decoded once per process and served from memory afterwards;
+    game loops match the same handful of templates every frame.
+    """
     path = str(template_path)
-    template = cv2.imread(path, cv2.IMREAD_COLOR)
+    key = (path, grayscale)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        _TEMPLATE_CACHE.pop(key, None)
+        raise FileNotFoundError(f"Template image not found: {path}")
+
+    cached = _TEMPLATE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    template = cv2.imread(path, cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR)
     if template is None:
         raise FileNotFoundError(f"Template image not found: {path}")
+    _TEMPLATE_CACHE[key] = (mtime, template)
     return template
 
 
@@ -103,6 +236,8 @@ def find_element(
         template_path: Path to the template PNG image.
         confidence: Minimum match confidence (0-1). Higher = stricter.
         screenshot: Optional pre-captured screenshot. If None, captures a new one.
+                    A single-channel (grayscale) screenshot is matched against
+                    the template in grayscale, which moves a third of the data.
 
     Returns:
         (x, y) center coordinates in logical (PyAutoGUI) space, or None if not found.
@@ -110,15 +245,31 @@ def find_element(
     if screenshot is None:
         screenshot = take_screenshot()
 
-    template = _load_template(template_path)
+    template = _load_template(template_path, grayscale=screenshot.ndim == 2)
     result = cv2.matchTemplate(screenshot, template, cv2.TM_CCOEFF_NORMED)
+    return _best_match(result, template.shape, template_path, confidence)
+
+
+def _best_match(
+    result: np.ndarray | cv2.UMat,
+    template_shape: tuple[int, ...],
+    template_path: str | Path,
+    confidence: float,
+    offset: tuple[int, int] = (0, 0),
+) -> Optional[tuple[int, int]]:
+    """
+    Turn a TM_CCOEFF_NORMED result map (ndarray or UMat) into a logical center.
+
+    *offset* is the (x, y) pixel origin of the searched window when the map
+    was computed on a crop of the screenshot.
+    """
     _, max_val, _, max_loc = cv2.minMaxLoc(result)
 
     if max_val >= confidence:
         # max_loc is top-left corner in pixel coordinates
-        t_h, t_w = template.shape[:2]
-        center_x = max_loc[0] + t_w // 2
-        center_y = max_loc[1] + t_h // 2
+        t_h, t_w = template_shape[:2]
+        center_x = offset[0] + max_loc[0] + t_w // 2
+        center_y = offset[1] + max_loc[1] + t_h // 2
 
         # Convert from retina pixel coordinates to logical PyAutoGUI coordinates
         logical_x = center_x // _RETINA_SCALE
@@ -134,6 +285,225 @@ def find_element(
     return None
 
 
+# Coarse pyramid levels are skipped when they would shrink a template below this
+_PYRAMID_MIN_TEMPLATE_PX = 12
+
+
+def _match_coarse_to_fine(
+    pyramid: list[np.ndarray],
+    template: np.ndarray,
+    template_path: str | Path,
+    confidence: float,
+    early_exit: bool = False,
+) -> Optional[tuple[int, int]]:
+    """
+    Locate *template* using a screenshot pyramid (pyramid[0] is full resolution).
+
+    The best candidate is found on the coarsest usable level, then re-scored at
+    full resolution in a small window around it.  TM_CCOEFF_NORMED is local, so
+    window scores equal full-search scores; if the window does not reach
+    *confidence* the full-resolution search runs as a fallback, so a weak
+    coarse pass can cost time but never a match.  With *early_exit* that
+    fallback is the tiled scan of :func:`_match_tiled`.
+    """
+    t_h, t_w = template.shape[:2]
+    level = len(pyramid) - 1
+    while level and min(t_h, t_w) >> level < _PYRAMID_MIN_TEMPLATE_PX:
+        level -= 1
+
+    if level:
+        small = template
+        for _ in range(level):
+            small = cv2.pyrDown(small)
+        coarse = cv2.matchTemplate(pyramid[level], small, cv2.TM_CCOEFF_NORMED)
+        _, _, _, (cx, cy) = cv2.minMaxLoc(coarse)
+
+        factor = 1 << level
+        pad = 2 * factor
+        full = pyramid[0]
+        x0 = max(cx * factor - pad, 0)
+        y0 = max(cy * factor - pad, 0)
+        x1 = min(cx * factor + t_w + pad, full.shape[1])
+        y1 = min(cy * factor + t_h + pad, full.shape[0])
+        if x1 - x0 >= t_w and y1 - y0 >= t_h:
+            result = cv2.matchTemplate(full[y0:y1, x0:x1], template, cv2.TM_CCOEFF_NORMED)
+            pos = _best_match(result, template.shape, template_path, confidence, offset=(x0, y0))
+            if pos is not None:
+                return pos
+
+    if early_exit:
+        return _match_tiled(pyramid[0], template, template_path, confidence)
+    result = cv2.matchTemplate(pyramid[0], template, cv2.TM_CCOEFF_NORMED)
+    return _best_match(result, template.shape, template_path, confidence)
+
+
+# Side of the square block of match positions scored per tile by _match_tiled
+_TILE_PX = 512
+
+
+def _match_tiled(
+    screenshot: np.ndarray,
+    template: np.ndarray,
+    template_path: str | Path,
+    confidence: float,
+    tile: int = _TILE_PX,
+) -> Optional[tuple[int, int]]:
+    """
+    Full-resolution search that stops at the first tile reaching *confidence*.
+
+    Tiles overlap by the template size, so every position is scored exactly
+    once and TM_CCOEFF_NORMED scores equal the full search.  A present
+    template usually costs a fraction of the scan; a missing one costs the
+    whole scan, as before.  The result is the best match in the first
+    qualifying tile, which is not necessarily the best on screen, so this
+    suits presence checks rather than picking between duplicates.
+    """
+    t_h, t_w = template.shape[:2]
+    h, w = screenshot.shape[:2]
+    for y0 in range(0, h - t_h + 1, tile):
+        y1 = min(y0 + tile + t_h - 1, h)
+        for x0 in range(0, w - t_w + 1, tile):
+            x1 = min(x0 + tile + t_w - 1, w)
+            result = cv2.matchTemplate(screenshot[y0:y1, x0:x1], template, cv2.TM_CCOEFF_NORMED)
+            if cv2.minMaxLoc(result)[1] >= confidence:
+                return _best_match(result, template.shape, template_path, confidence, offset=(x0, y0))
+
+    logger.debug(f"Not found: {template_path} (tiled, need={confidence})")
+    return None
+
+
+def _match_near(
+    screenshot: np.ndarray,
+    template_path: str | Path,
+    confidence: float,
+    bbox: dict,
+    padding: int,
+) -> Optional[tuple[int, int]]:
+    """
+    Match *template_path* only inside *bbox* (logical x/y/w/h) grown by *padding*.
+
+    Returns None when the template is not found there (or does not fit).
+    """
+    s = _RETINA_SCALE
+    x0 = max(bbox["x"] - padding, 0)
+    y0 = max(bbox["y"] - padding, 0)
+    x1 = bbox["x"] + bbox["w"] + padding
+    y1 = bbox["y"] + bbox["h"] + padding
+    roi = screenshot[y0 * s : y1 * s, x0 * s : x1 * s]
+
+    template = _load_template(template_path, grayscale=screenshot.ndim == 2)
+    t_h, t_w = template.shape[:2]
+    if roi.shape[0] < t_h or roi.shape[1] < t_w:
+        return None
+    result = cv2.matchTemplate(roi, template, cv2.TM_CCOEFF_NORMED)
+    return _best_match(result, template.shape, template_path, confidence, offset=(x0 * s, y0 * s))
+
+
+def find_elements(
+    templates: dict[str, str | Path],
+    confidence: float = 0.8,
+    screenshot: Optional[np.ndarray] = None,
+    grayscale: bool = False,
+    use_opencl: bool = False,
+    pyramid_levels: int = 0,
+    search_hints: Optional[dict[str, dict]] = None,
+    hint_padding: int = 50,
+    jobs: int = 1,
+    early_exit: bool = False,
+) -> dict[str, Optional[tuple[int, int]]]:
+    """
+    Find several UI elements against one shared screenshot.
+
+    The screenshot is captured (and, with ``grayscale=True``, converted) once
+    for the whole batch instead of once per template.
+
+    Args:
+        templates: Dict mapping name -> template_path.
+        confidence: Minimum match confidence (0-1).
+        screenshot: Optional pre-captured BGR screenshot. If None, captures a new one.
+        grayscale: Match every template in grayscale.
+        use_opencl: Run matchTemplate through OpenCV's T-API (cv2.UMat) so it
+                    can use the GPU. The screenshot is uploaded once; only the
+                    min/max search result comes back. Ignored when OpenCL is
+                    unavailable. The first call pays for kernel compilation.
+                    Every template gets one full search on this path, so
+                    pyramid_levels, search_hints, jobs and early_exit are
+                    ignored (with a warning). OpenCL is switched on only for
+                    the duration of the call.
+        pyramid_levels: When > 0 (and not using OpenCL), search each template
+                        coarse-to-fine on a screenshot pyramid built once for
+                        the batch; level N searches at 1/2**N resolution first.
+        search_hints: Optional dict mapping name -> logical x/y/w/h box where the
+                      template was last seen. Those templates are first matched
+                      only inside the box grown by *hint_padding* (logical
+                      pixels), falling back to the normal search on a miss.
+        jobs: Match up to this many templates at once on worker threads
+              (CPU path only). Results keep the order of *templates*.
+        early_exit: Run full-resolution searches tile by tile and stop at the
+                    first tile reaching *confidence* (CPU path only; see
+                    _match_tiled). Meant for presence checks.
+
+    Returns:
+        Dict mapping name -> (x, y) logical center, or None if not found,
+        in the same order as *templates*.
+    """
+    if screenshot is None:
+        screenshot = take_screenshot()
+    if grayscale and screenshot.ndim == 3:
+        screenshot = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+
+    if not (use_opencl and cv2.ocl.haveOpenCL()):
+        pyramid = [screenshot]
+        for _ in range(pyramid_levels):
+            pyramid.append(cv2.pyrDown(pyramid[-1]))
+
+        def locate(name: str, path: str | Path) -> Optional[tuple[int, int]]:
+            pos = None
+            bbox = (search_hints or {}).get(name)
+            if bbox:
+                pos = _match_near(screenshot, path, confidence, bbox, hint_padding)
+            if pos is None and pyramid_levels > 0:
+                template = _load_template(path, grayscale=screenshot.ndim == 2)
+                pos = _match_coarse_to_fine(pyramid, template, path, confidence, early_exit)
+            elif pos is None and early_exit:
+                template = _load_template(path, grayscale=screenshot.ndim == 2)
+                pos = _match_tiled(screenshot, template, path, confidence)
+            elif pos is None:
+                pos = find_element(path, confidence, screenshot=screenshot)
+            return pos
+
+        if jobs > 1 and len(templates) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # matchTemplate releases the GIL, so templates match in parallel
+            with ThreadPoolExecutor(max_workers=min(jobs, len(templates))) as pool:
+                found = pool.map(locate, templates.keys(), templates.values())
+                return dict(zip(templates.keys(), found))
+        return {name: locate(name, path) for name, path in templates.items()}
+
+    ignored = [
+        name for name, value in (
+            ("pyramid_levels", pyramid_levels), ("search_hints", search_hints),
+            ("jobs", jobs > 1), ("early_exit", early_exit),
+        ) if value
+    ]
+    if ignored:
+        logger.warning(f"OpenCL matching ignores: {', '.join(ignored)}")
+
+    was_enabled = cv2.ocl.useOpenCL()
+    cv2.ocl.setUseOpenCL(True)
+    try:
+        screen_umat = cv2.UMat(screenshot)
+        matches = {}
+        for name, path in templates.items():
+            template = _load_template(path, grayscale=screenshot.ndim == 2)
+            result = cv2.matchTemplate(screen_umat, cv2.UMat(template), cv2.TM_CCOEFF_NORMED)
+            matches[name] = _best_match(result, template.shape, path, confidence)
+    finally:
+        cv2.ocl.setUseOpenCL(was_enabled)
+    return matches
+
+
 def find_all_elements(
     template_path: str | Path,
     confidence: float = 0.8,
@@ -149,7 +519,8 @@ def find_all_elements(
         template_path: Path to the template PNG image.
         confidence: Minimum match confidence (0-1).
         min_distance: Minimum pixel distance between matches (to avoid duplicates).
-        screenshot: Optional pre-captured screenshot.
+        screenshot: Optional pre-captured screenshot (BGR, or grayscale to
+                    match in grayscale).
 
     Returns:
         List of (x, y) center coordinates in logical (PyAutoGUI) space.
@@ -157,7 +528,7 @@ def find_all_elements(
     if screenshot is None:
         screenshot = take_screenshot()
 
-    template = _load_template(template_path)
+    template = _load_template(template_path, grayscale=screenshot.ndim == 2)
     result = cv2.matchTemplate(screenshot, template, cv2.TM_CCOEFF_NORMED)
 
     # Find all locations above threshold
@@ -298,7 +669,7 @@ def wait_for_element(
     """
     start = time.time()
     while time.time() - start < timeout:
-        pos = find_element(template_path, confidence)
+        pos = find_element(template_path, confidence, screenshot=take_screenshot(reuse=True))
         if pos is not None:
             return pos
         time.sleep(poll_interval)
@@ -329,7 +700,7 @@ def wait_for_any_element(
     """
     start = time.time()
     while time.time() - start < timeout:
-        screenshot = take_screenshot()
+        screenshot = take_screenshot(reuse=True)
         for name, path in templates.items():
             pos = find_element(path, confidence, screenshot=screenshot)
             if pos is not None:
@@ -47,40 +47,233 @@ Only captures what's actually needed — most games need just 2-3 elements.
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import itertools
+import json
+import os
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, NamedTuple
 
-import cv2
-import numpy as np
-import pyautogui
-import pytesseract
-import yaml
-from InquirerPy import inquirer
-from InquirerPy.separator import Separator
+if TYPE_CHECKING:
+    import numpy as np
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.ocr_debug import preprocess_for_ocr
-from src.screen import find_element, init_retina_scale, take_screenshot
+# Separator line for console banners
+_BAR = "=" * 60
 
-# Set up tesseract path (same logic as src/screen.py)
-import shutil
+# The src.* capture stack, pytesseract, cv2, numpy, yaml, pyautogui and
+# InquirerPy are imported inside the functions that use them, so --help /
+# --help-game / --reset don't pay for loading them.
 
-_tesseract_path = shutil.which("tesseract") or "/opt/homebrew/bin/tesseract"
-if Path(_tesseract_path).exists():
-    pytesseract.pytesseract.tesseract_cmd = _tesseract_path
+
+@functools.lru_cache(maxsize=1)
+def _yaml():
+    """
+    Import PyYAML on first use.
+
+    Returns (yaml, Loader, Dumper), preferring the libyaml C loader/dumper
+    and falling back to the pure-Python ones when PyYAML was built without it.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as Dumper, CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeDumper as Dumper, SafeLoader as Loader
+    return yaml, Loader, Dumper
+
+
+def _load_yaml(stream):
+    """Parse a YAML document (safe loader)."""
+    yaml, loader, _ = _yaml()
+    return yaml.load(stream, Loader=loader)
+
+
+@functools.lru_cache(maxsize=1)
+def _pytesseract():
+    """Import pytesseract on first use and set its tesseract path (same logic as src/screen.py)."""
+    import shutil
+
+    import pytesseract
+
+    tesseract_path = shutil.which("tesseract") or "/opt/homebrew/bin/tesseract"
+    if Path(tesseract_path).exists():
+        pytesseract.pytesseract.tesseract_cmd = tesseract_path
+    return pytesseract
 
 
 def _ocr_preview(crop_2x: np.ndarray, preprocess: str = "thresh") -> str:
-    """Run OCR on a cropped 2x region and return the recognized text."""
+    """Run OCR on a cropped 2x region and return the recognized text.
+
+    *crop_2x* may be a slice view into the full screenshot — the
+    preprocessing pipeline reads it in place, so callers should pass the
+    view directly rather than copying or converting it first.
+    """
+    from src.ocr_debug import preprocess_for_ocr
+
     gray = preprocess_for_ocr(crop_2x, preprocess=preprocess)
-    text = pytesseract.image_to_string(gray, config="--psm 7")
+    text = _pytesseract().image_to_string(gray, config="--psm 7")
     return text.strip()
 
 
+# zlib level for saved template PNGs; set from --png-level in main().
+# None means no level was asked for: fpnge if installed, else level 1.
+_PNG_LEVEL: int | None = None
+_DEFAULT_PNG_LEVEL = 1
+
+
+# First fpnge exception, if any; fpnge stays disabled for the rest of the run
+_FPNGE_ERROR: Exception | None = None
+_FPNGE_ERROR_REPORTED = False
+
+
+@functools.lru_cache(maxsize=1)
+def _fpnge():
+    """The optional fpnge encoder module, or None if it isn't installed."""
+    try:
+        import fpnge
+    except ImportError:
+        return None
+    return fpnge
+
+
+def _report_fpnge_error() -> None:
+    """Print the fpnge failure once; call from the main thread, not a worker."""
+    global _FPNGE_ERROR_REPORTED
+    if _FPNGE_ERROR is not None and not _FPNGE_ERROR_REPORTED:
+        _FPNGE_ERROR_REPORTED = True
+        print(f"    fpnge failed ({_FPNGE_ERROR!r}) — using OpenCV for PNGs from now on")
+
+
+def _encode_png(img: np.ndarray, level: int | None = None) -> np.ndarray | bytes | None:
+    """
+    Encode *img* as PNG in memory. Returns None if encoding failed.
+
+    If no level was asked for (neither *level* nor --png-level) and the
+    optional ``fpnge`` package is installed (``pip install fpnge``), its SIMD
+    encoder is used; it is several times faster than libpng on screen crops
+    but has no compression level.  Otherwise OpenCV encodes at the requested
+    level (default 1) with zlib's RLE strategy: UI crops are mostly flat
+    colour, so it keeps nearly all of the size win while skipping deflate's
+    match search.  The first fpnge error disables it for the rest of the run;
+    it is recorded rather than printed, since this may run on a worker thread
+    (see _report_fpnge_error).
+
+    The OpenCV result is its uint8 buffer itself; it supports the buffer
+    protocol, so Path.write_bytes takes it without a tobytes() copy.
+    """
+    import cv2
+
+    global _FPNGE_ERROR
+    level = _PNG_LEVEL if level is None else level
+    fpnge = _fpnge() if level is None and _FPNGE_ERROR is None else None
+    if fpnge is not None:
+        try:
+            rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB) if img.ndim == 3 else img
+            return fpnge.fromNP(rgb)
+        except Exception as e:
+            if _FPNGE_ERROR is None:
+                _FPNGE_ERROR = e
+    if level is None:
+        level = _DEFAULT_PNG_LEVEL
+
+    params = [
+        cv2.IMWRITE_PNG_COMPRESSION, level,
+        cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_RLE,
+    ]
+    ok, buf = cv2.imencode(".png", img, params)
+    return buf if ok else None
+
+
+def _save_png(path: Path, img: np.ndarray, level: int | None = None) -> bool:
+    """
+    Encode *img* as PNG in memory and write it to *path* in one call.
+
+    Bypasses OpenCV's own file layer (and its filename re-encoding), so
+    non-ASCII asset paths work too.  Returns False if encoding failed.
+    """
+    data = _encode_png(img, level)
+    _report_fpnge_error()
+    if data is not None:
+        path.write_bytes(data)
+    return data is not None
+
+
+class AssetWriter:
+    """
+    Batches captured template PNGs and writes them to disk in one pass.
+
+    ``enqueue()`` hands the PNG encode to a worker thread and returns
+    immediately, so the next interactive prompt isn't held up by libpng.
+    ``flush()`` waits for the encodes and writes every queued file back to
+    back on the calling thread, printing "Saved" or "Failed" for each.  Used
+    as a context manager it flushes on exit — including when a capture is
+    cancelled part-way through.
+
+    Crops with identical pixels share one encode; each still gets its own
+    file, since every element is referenced by its own filename.
+    """
+
+    def __init__(self, jobs: int = 4, level: int | None = None):
+        self._pool = ThreadPoolExecutor(max_workers=max(1, jobs))
+        self._level = level
+        self._pending: list[tuple[Path, Future]] = []
+        # Pixel digest -> encode job, so identical crops are encoded only once
+        self._encoded: dict[str, Future] = {}
+
+    def enqueue(self, path: Path, img: np.ndarray) -> None:
+        """Queue *img* to be written to *path* as a PNG."""
+        import numpy as np
+
+        # Copy so the worker owns its pixels (crops are views into a full frame)
+        pixels = np.ascontiguousarray(img).copy()
+        digest = hashlib.blake2b(pixels.data, digest_size=16)
+        digest.update(repr((pixels.shape, pixels.dtype.str)).encode())
+        key = digest.hexdigest()
+
+        encoded = self._encoded.get(key)
+        if encoded is None:
+            encoded = self._pool.submit(_encode_png, pixels, self._level)
+            self._encoded[key] = encoded
+        self._pending.append((path, encoded))
+
+    def flush(self) -> None:
+        """Write every queued asset to disk, reporting each as saved or failed."""
+        pending, self._pending = self._pending, []
+        for path, encoded in pending:
+            try:
+                data = encoded.result()
+                if data is None:
+                    print(f"    Failed: {path} (PNG encode failed) — not saved")
+                    continue
+                path.write_bytes(data)
+            except Exception as e:
+                print(f"    Failed: {path} ({e!r}) — not saved")
+                continue
+            print(f"    Saved: {path}")
+        _report_fpnge_error()
+
+    def close(self) -> None:
+        """Flush outstanding writes and stop the worker threads."""
+        try:
+            self.flush()
+        finally:
+            self._pool.shutdown()
+
+    def __enter__(self) -> AssetWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
 # ── Common optional elements (shared across all games) ───────────────────
 COMMON_OPTIONAL_ELEMENTS = [
     ("reality_check", "Reality check popup button (the button to dismiss the popup)"),
@@ -187,7 +380,25 @@ GAME_DEFS = {
     },
 }
 
-KNOWN_GAMES = list(GAME_DEFS.keys())
+KNOWN_GAMES = tuple(GAME_DEFS)
+
+
+def _build_desc_maps(defs: dict) -> dict[str, dict[str, str]]:
+    """Name -> description lookups for one game's elements, regions and positions."""
+    elements = {name: desc for name, desc, *_ in defs["elements"]}
+    elements.update(defs["optional_elements"])
+    elements.update(COMMON_OPTIONAL_ELEMENTS)
+    return {
+        "elements": elements,
+        "regions": dict(defs["regions"]),
+        "positions": dict(defs["positions"]),
+    }
+
+
+# Built once at import instead of in every capture / menu helper
+_DESC_MAPS: dict[str, dict[str, dict[str, str]]] = {
+    game: _build_desc_maps(defs) for game, defs in GAME_DEFS.items()
+}
 
 # ── State groups for snapshot capture mode ────────────────────────────────
 # Maps games (with multiple live states) to a list of state groups.
@@ -277,6 +488,8 @@ def reset_game(game: str) -> None:
     if config_path.exists():
         config_path.unlink()
         deleted.append(str(config_path))
+    _config_hash_path(config_path).unlink(missing_ok=True)
+    _compiled_config_path(config_path).unlink(missing_ok=True)
 
     if deleted:
         print(f"\n  Reset '{game}' — deleted:")
@@ -287,57 +500,193 @@ def reset_game(game: str) -> None:
         print(f"\n  Nothing to reset for '{game}'.\n")
 
 
-def capture_screenshot_region() -> tuple[np.ndarray, dict] | None:
+def _done_banner_template(game: str) -> str:
+    """Post-capture "next steps" banner for *game*; only {config_path} is left open."""
+    return "\n".join([
+        "",
+        _BAR,
+        "  Done! Next steps:",
+        "  1. Review config: {config_path}",
+        f"  2. Test: python3 tools/capture.py --game {game} --test",
+        "  3. Run: python3 main.py --config {config_path} --duration 60",
+        _BAR,
+        "",
+        "",
+    ])
+
+
+# Banners are specialised per game once at import; printing one is a single format
+_DONE_BANNERS: dict[str, str] = {g: _done_banner_template(g) for g in KNOWN_GAMES}
+
+
+def _print_done_banner(config_path: str, game: str) -> None:
+    """Print the post-capture "next steps" banner in a single write."""
+    template = _DONE_BANNERS.get(game) or _done_banner_template(game)
+    sys.stdout.write(template.format(config_path=config_path))
+    sys.stdout.flush()
+
+
+class _Point(NamedTuple):
+    x: int
+    y: int
+
+
+@functools.lru_cache(maxsize=1)
+def _mouse_position_reader():
+    """
+    Pick the cheapest cursor-position call for this platform, once.
+
+    macOS reads the location straight from Quartz and Windows from
+    GetCursorPos, skipping pyautogui's import-time helpers; anything else
+    (or a missing backend) falls back to pyautogui.position().  A failed
+    GetCursorPos call (e.g. on the secure desktop) also uses pyautogui
+    rather than reporting (0, 0).
+    """
+    def pyautogui_read():
+        import pyautogui
+
+        pos = pyautogui.position()
+        return pos.x, pos.y
+
+    if sys.platform == "darwin":
+        try:
+            from Quartz import CGEventCreate, CGEventGetLocation
+
+            def read():
+                pt = CGEventGetLocation(CGEventCreate(None))
+                return int(pt.x), int(pt.y)
+            return read
+        except ImportError:
+            pass
+    elif sys.platform == "win32":
+        import ctypes
+        import ctypes.wintypes
+
+        def read():
+            pt = ctypes.wintypes.POINT()
+            if not ctypes.windll.user32.GetCursorPos(ctypes.byref(pt)):
+                return pyautogui_read()
+            return pt.x, pt.y
+        return read
+
+    return pyautogui_read
+
+
+def _mouse_position() -> _Point:
+    """Current mouse position in logical (PyAutoGUI) coordinates."""
+    return _Point(*_mouse_position_reader()())
+
+
+def _corners_to_box(ax: int, ay: int, bx: int, by: int) -> tuple[int, int, int, int]:
+    """Normalise two opposite corners into an (x1, y1, x2, y2) box."""
+    if ax > bx:
+        ax, bx = bx, ax
+    if ay > by:
+        ay, by = by, ay
+    return ax, ay, bx, by
+
+
+def capture_screenshot_region(shots: dict | None = None) -> tuple[np.ndarray, dict] | None:
     """
     Let the user select a region on screen by clicking two corners.
 
+    The screen is grabbed fresh after the corners are confirmed, so each
+    crop shows what is on screen now.
+
+    Args:
+        shots: Optional per-step cache holding the last grab under
+            "screenshot" (and its monotonic time under "grabbed_at").  When
+            it has one, typing 's' at a corner prompt crops from that grab
+            instead of taking a new one — only for elements visible on the
+            same screen as the previous capture.
+
     Returns:
         Tuple of (cropped image as numpy array, region dict) or None if cancelled.
     """
-    print("    Position cursor on TOP-LEFT corner, press Enter")
-    input("    > ")
-    pos1 = pyautogui.position()
+    hint = ""
+    if shots and "screenshot" in shots:
+        age = time.monotonic() - shots["grabbed_at"]
+        hint = f", or 's' + Enter to reuse the previous screen grab ({age:.0f}s old)"
+    print(f"    Position cursor on TOP-LEFT corner, press Enter{hint}")
+    reuse = input("    > ").strip().lower() == "s"
+    pos1 = _mouse_position()
     print(f"    Top-left: ({pos1.x}, {pos1.y})")
 
     print("    Position cursor on BOTTOM-RIGHT corner, press Enter")
-    input("    > ")
-    pos2 = pyautogui.position()
+    reuse = input("    > ").strip().lower() == "s" or reuse
+    pos2 = _mouse_position()
     print(f"    Bottom-right: ({pos2.x}, {pos2.y})")
 
-    # Take screenshot and crop
-    screenshot = take_screenshot()
-    scale = 2  # Retina scale
+    from src.screen import init_retina_scale
+
+    scale = init_retina_scale()  # detected once per process, then cached
 
-    x1 = min(pos1.x, pos2.x) * scale
-    y1 = min(pos1.y, pos2.y) * scale
-    x2 = max(pos1.x, pos2.x) * scale
-    y2 = max(pos1.y, pos2.y) * scale
+    lx1, ly1, lx2, ly2 = _corners_to_box(pos1.x, pos1.y, pos2.x, pos2.y)
+    x1, y1, x2, y2 = lx1 * scale, ly1 * scale, lx2 * scale, ly2 * scale
 
     if x2 - x1 < 4 or y2 - y1 < 4:
         print("    Region too small — try again")
         return None
 
+    # Take a fresh screenshot (or, if asked, reuse the previous grab) and crop
+    screenshot = shots.get("screenshot") if shots and reuse else None
+    if screenshot is None:
+        from src.screen import take_screenshot
+
+        screenshot = take_screenshot()
+        if shots is not None:
+            shots["screenshot"] = screenshot
+            shots["grabbed_at"] = time.monotonic()
+
     cropped = screenshot[y1:y2, x1:x2]
 
     region = {
-        "x": min(pos1.x, pos2.x),
-        "y": min(pos1.y, pos2.y),
-        "w": abs(pos2.x - pos1.x),
-        "h": abs(pos2.y - pos1.y),
+        "x": lx1,
+        "y": ly1,
+        "w": lx2 - lx1,
+        "h": ly2 - ly1,
     }
 
     return cropped, region
 
 
+def _capture_region_with_retry(shots: dict | None = None) -> tuple[np.ndarray, dict] | None:
+    """
+    capture_screenshot_region with one retry on failure.
+
+    Both attempts share *shots*, so the retry can still offer the previous
+    grab for reuse.
+    """
+    result = capture_screenshot_region(shots)
+    if result is None:
+        print("    Failed — try again")
+        result = capture_screenshot_region(shots)
+    return result
+
+
 def capture_position(prompt: str) -> tuple[int, int]:
     """Capture a single screen position (for bet click targets)."""
     print(f"    {prompt}")
     input("    > ")
-    pos = pyautogui.position()
+    pos = _mouse_position()
     print(f"    Position: ({pos.x}, {pos.y})")
     return (pos.x, pos.y)
 
 
+def _parse_index_selection(answer: str, count: int) -> set[int]:
+    """Parse a '1,3,5' / 'all' answer into a set of 1-based indices."""
+    answer = answer.strip().lower()
+    if answer in ("a", "all"):
+        return set(range(1, count + 1))
+    wanted = set()
+    for part in answer.replace(" ", ",").split(","):
+        if part.isdigit() and 1 <= int(part) <= count:
+            wanted.add(int(part))
+        elif part:
+            print(f"    Ignoring '{part}' (expected 1-{count})")
+    return wanted
+
+
 def capture_elements(game: str) -> dict:
     """Walk through capturing elements for a game — only the essentials."""
     asset_dir = PROJECT_ROOT / "assets" / game
@@ -351,71 +700,77 @@ def capture_elements(game: str) -> dict:
     positions_list = defs["positions"]
 
     captured_elements = {}
+    captured_bboxes = {}
     captured_regions = {}
     captured_positions = {}
 
-    print(f"\n{'='*60}")
+    print(f"\n{_BAR}")
     print(f"  Capturing assets for: {game}")
     print(f"  Asset directory: {asset_dir}")
-    print(f"{'='*60}")
+    print(f"{_BAR}")
     print()
     print("  Make sure the game is open and visible in Chrome.")
     print()
 
-    # ── Step 1: Required elements (image templates) ──
-    print(f"--- Required Elements ({len(required_elements)}) ---\n")
-    for elem_name, description, _required in required_elements:
-        print(f"  [{elem_name}] {description}")
-        result = capture_screenshot_region()
-        if result is None:
-            print("    Failed — try again")
-            result = capture_screenshot_region()
-        if result is None:
-            print("    Skipped (bot may not work correctly without this).\n")
-            continue
-
-        img, region = result
-        filename = f"{elem_name}.png"
-        filepath = asset_dir / filename
-        cv2.imwrite(str(filepath), img)
-        captured_elements[elem_name] = filename
-        print(f"    Saved: {filepath}\n")
-
-    # ── Step 2: Optional elements (game-specific + common) ──
-    all_optional = list(optional_elements) + COMMON_OPTIONAL_ELEMENTS
-    if all_optional:
-        print(f"\n--- Optional Elements ({len(all_optional)}) ---\n")
-        for elem_name, description in all_optional:
-            answer = input(f"  [{elem_name}] {description}\n    Capture this? (y/n): ").strip().lower()
-            if answer != "y":
-                print("    Skipped.\n")
-                continue
-
-            result = capture_screenshot_region()
+    # Element PNGs are encoded in the background while the next prompt is
+    # shown, and written to disk together once the template steps are done
+    with AssetWriter() as writer:
+        # ── Step 1: Required elements (image templates) ──
+        print(f"--- Required Elements ({len(required_elements)}) ---\n")
+        # Last grab of any element or region, reusable on request with 's'
+        shots: dict = {}
+        for elem_name, description, _required in required_elements:
+            print(f"  [{elem_name}] {description}")
+            result = _capture_region_with_retry(shots)
             if result is None:
-                print("    Failed — try again")
-                result = capture_screenshot_region()
-            if result is None:
-                print("    Skipped.\n")
+                print("    Skipped (bot may not work correctly without this).\n")
                 continue
 
             img, region = result
             filename = f"{elem_name}.png"
             filepath = asset_dir / filename
-            cv2.imwrite(str(filepath), img)
+            writer.enqueue(filepath, img)
             captured_elements[elem_name] = filename
-            print(f"    Saved: {filepath}\n")
+            captured_bboxes[elem_name] = region
+            print(f"    Queued: {filepath}\n")
+
+        # ── Step 2: Optional elements (game-specific + common) ──
+        all_optional = list(optional_elements) + COMMON_OPTIONAL_ELEMENTS
+        if all_optional:
+            print(f"\n--- Optional Elements ({len(all_optional)}) ---\n")
+            for i, (elem_name, description) in enumerate(all_optional, 1):
+                print(f"  {i:>2}. [{elem_name}] {description}")
+            answer = input("\n  Capture which? (e.g. 1,3 or 'all', blank for none): ")
+            wanted = _parse_index_selection(answer, len(all_optional))
+            print()
+
+            for i, (elem_name, description) in enumerate(all_optional, 1):
+                if i not in wanted:
+                    continue
+
+                print(f"  [{elem_name}] {description}")
+                result = _capture_region_with_retry(shots)
+                if result is None:
+                    print("    Skipped.\n")
+                    continue
+
+                img, region = result
+                filename = f"{elem_name}.png"
+                filepath = asset_dir / filename
+                writer.enqueue(filepath, img)
+                captured_elements[elem_name] = filename
+                captured_bboxes[elem_name] = region
+                print(f"    Queued: {filepath}\n")
 
     # ── Step 3: OCR Regions ──
     if regions_list:
         print(f"\n--- OCR Regions ({len(regions_list)}) ---\n")
         print("  For each region, select the area containing the number to read.\n")
+        # Each region is grabbed fresh; the last element grab is only offered
+        # for reuse ('s', with its age shown) and never taken automatically
         for region_name, description in regions_list:
             print(f"  [{region_name}] {description}")
-            result = capture_screenshot_region()
-            if result is None:
-                print("    Failed — try again")
-                result = capture_screenshot_region()
+            result = _capture_region_with_retry(shots)
             if result is None:
                 print("    Skipped.\n")
                 continue
@@ -442,23 +797,93 @@ def capture_elements(game: str) -> dict:
 
     return {
         "elements": captured_elements,
+        "element_bboxes": captured_bboxes,
         "regions": captured_regions,
         "positions": captured_positions,
         "asset_dir": f"assets/{game}/",
     }
 
 
-def generate_yaml_config(game: str, captured: dict) -> str:
+def _write_yaml(path: Path, config: dict) -> None:
+    """
+    Write *config* to *path* as YAML in one buffered write.
+
+    The document is emitted into memory first, written to a temp file, then
+    moved over *path* with os.replace, so a crash never leaves a
+    half-written config behind.  Also (re)writes the ``<stem>_config.py``
+    literal companion next to it (see _write_compiled_config).
+    """
+    yaml, _, dumper = _yaml()
+    data = yaml.dump(
+        config, Dumper=dumper,
+        default_flow_style=False, sort_keys=False, encoding="utf-8",
+    )
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    _write_compiled_config(path, config)
+
+
+def _compiled_config_path(config_path: Path) -> Path:
+    """Python-literal companion of a YAML config (slots.yaml -> slots_config.py)."""
+    return config_path.with_name(f"{config_path.stem}_config.py")
+
+
+def _write_compiled_config(config_path: Path, config: dict) -> None:
+    """
+    Write *config* as a ``CONFIG = {...}`` Python literal next to the YAML.
+
+    BaseGame reads it with ast.literal_eval (it is never imported) instead
+    of re-parsing the YAML as long as it is not older than the YAML file, so
+    hand edits to the YAML still win.
+    """
+    import pprint
+
+    py_path = _compiled_config_path(config_path)
+    tmp_path = py_path.with_name(py_path.name + ".tmp")
+    tmp_path.write_text(
+        f"# Generated from {config_path.name} by tools/capture.py - do not edit.\n"
+        f"CONFIG = {pprint.pformat(config, width=120, sort_dicts=False)}\n",
+        encoding="utf-8",  # BaseGame reads it back as UTF-8 on every platform
+    )
+    os.replace(tmp_path, py_path)
+
+
+def _config_hash_path(config_path: Path) -> Path:
+    """Sidecar file recording the digest of the last generated config."""
+    return config_path.with_name(config_path.name + ".hash")
+
+
+def _config_digest(game: str, captured: dict, config_bytes: bytes) -> str:
+    """Digest of the captured data together with the config file it was merged into."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(json.dumps([game, captured], sort_keys=True).encode())
+    h.update(config_bytes)
+    return h.hexdigest()
+
+
+def generate_yaml_config(game: str, captured: dict, force: bool = False) -> str:
     """Generate (or merge into) a YAML config file from captured data.
 
     If a config file already exists, newly captured elements, regions, and
     positions are merged into it so that previously configured values are
     preserved.  Only keys that were actually captured (non-empty) overwrite
     existing values.
+
+    Merging is idempotent, so when the same captured data is applied to the
+    config this function last wrote (tracked by a ``<config>.hash`` sidecar),
+    the rewrite is skipped.  Pass ``force=True`` to always regenerate.
     """
     config_dir = PROJECT_ROOT / "config" / "games"
     config_dir.mkdir(parents=True, exist_ok=True)
     config_path = config_dir / f"{game}.yaml"
+    hash_path = _config_hash_path(config_path)
+
+    if not force and config_path.exists() and hash_path.exists():
+        digest = _config_digest(game, captured, config_path.read_bytes())
+        if hash_path.read_text().strip() == digest:
+            print(f"\n  Config unchanged: {config_path}")
+            return str(config_path)
 
     config_generators = {
         "slot": _generate_slot_config,
@@ -473,10 +898,16 @@ def generate_yaml_config(game: str, captured: dict) -> str:
     else:
         new_config = {}
 
+    # Where each template was captured (logical x/y/w/h).  Kept out of
+    # "elements", whose values the game runners read as filenames; used by
+    # --test to search near the original spot first.
+    if captured.get("element_bboxes"):
+        new_config["element_bboxes"] = dict(captured["element_bboxes"])
+
     # If a config already exists, merge newly captured data into it
     if config_path.exists():
         with open(config_path) as f:
-            existing = yaml.safe_load(f) or {}
+            existing = _load_yaml(f) or {}
 
         # Merge elements: add new, keep existing
         existing_elements = existing.get("elements", {})
@@ -492,6 +923,11 @@ def generate_yaml_config(game: str, captured: dict) -> str:
             existing_regions.update(new_regions)
         existing["regions"] = existing_regions
 
+        # Merge capture bboxes the same way
+        new_bboxes = new_config.get("element_bboxes", {})
+        if new_bboxes:
+            existing.setdefault("element_bboxes", {}).update(new_bboxes)
+
         # Merge positions / bet_spot: only overwrite if actually captured
         # (detect zero-value defaults that indicate "not captured")
         for pos_key in ("bet_spot",):
@@ -510,8 +946,12 @@ def generate_yaml_config(game: str, captured: dict) -> str:
     else:
         config = new_config
 
-    with open(config_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+    _write_yaml(config_path, config)
+
+    # Record what was written so an identical re-run can skip the rewrite
+    tmp_path = hash_path.with_name(hash_path.name + ".tmp")
+    tmp_path.write_text(_config_digest(game, captured, config_path.read_bytes()) + "\n")
+    os.replace(tmp_path, hash_path)
 
     print(f"\n  Config saved: {config_path}")
     return str(config_path)
@@ -620,8 +1060,21 @@ def _generate_infinite_blackjack_config(game: str, captured: dict) -> dict:
     }
 
 
-def update_single_asset(game: str, element_name: str) -> None:
-    """Re-capture a single asset for an existing game."""
+def update_single_asset(
+    game: str,
+    element_name: str,
+    writer: AssetWriter | None = None,
+    config: dict | None = None,
+) -> None:
+    """
+    Re-capture a single asset for an existing game.
+
+    The region capture is interactive and always runs on the calling thread.
+    If *writer* is given, the PNG is queued on it instead of being written
+    before the next prompt; the caller is responsible for flushing it.
+    If *config* is given, the change is applied to that dict and the caller
+    writes it; otherwise the game's YAML is loaded and rewritten here.
+    """
     asset_dir = PROJECT_ROOT / "assets" / game
     config_path = PROJECT_ROOT / "config" / "games" / f"{game}.yaml"
 
@@ -632,18 +1085,15 @@ def update_single_asset(game: str, element_name: str) -> None:
 
     asset_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"\n{'='*60}")
+    print(f"\n{_BAR}")
     print(f"  Updating asset '{element_name}' for: {game}")
-    print(f"{'='*60}")
+    print(f"{_BAR}")
     print()
     print("  Make sure the game is open and visible in Chrome.")
     print()
 
     print(f"  [{element_name}] Select the region for this element")
-    result = capture_screenshot_region()
-    if result is None:
-        print("    Failed — try again")
-        result = capture_screenshot_region()
+    result = _capture_region_with_retry({})
     if result is None:
         print("    Cancelled.\n")
         sys.exit(1)
@@ -651,17 +1101,25 @@ def update_single_asset(game: str, element_name: str) -> None:
     img, region = result
     filename = f"{element_name}.png"
     filepath = asset_dir / filename
-    cv2.imwrite(str(filepath), img)
-    print(f"    Saved: {filepath}")
+    if writer is not None:
+        writer.enqueue(filepath, img)
+        print(f"    Queued: {filepath}")
+    elif _save_png(filepath, img):
+        print(f"    Saved: {filepath}")
+    else:
+        print(f"    Failed: {filepath} (PNG encode failed) — not saved")
 
     # Update the YAML config to include this element if it's not already there
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    own_config = config is None
+    if own_config:
+        with open(config_path) as f:
+            config = _load_yaml(f)
 
     elements = config.get("elements", {})
     if element_name not in elements:
         elements[element_name] = filename
         config["elements"] = elements
+    config.setdefault("element_bboxes", {})[element_name] = region
 
     # For reality_check, also capture where to click to dismiss
     if element_name == "reality_check":
@@ -672,15 +1130,25 @@ def update_single_asset(game: str, element_name: str) -> None:
         config["settings"] = settings
         print(f"    Click position set to: ({pos[0]}, {pos[1]})")
 
-    with open(config_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-    print(f"    Config updated: {config_path}")
-
-    print(f"\n  Done! Test with: python3 tools/capture.py --game {game} --test\n")
+    if own_config:
+        _write_yaml(config_path, config)
+        print(f"    Config updated: {config_path}")
+        print(f"\n  Done! Test with: python3 tools/capture.py --game {game} --test\n")
 
 
-def test_assets(game: str) -> None:
-    """Test if all captured assets can be found on the current screen."""
+def test_assets(
+    game: str, use_opencl: bool = False, jobs: int = 4, grayscale: bool = False,
+) -> None:
+    """
+    Test if all captured assets can be found on the current screen.
+
+    Templates are matched on up to *jobs* threads; results are still printed
+    in config order.  With *use_opencl*, matching runs through OpenCV's T-API
+    instead, as one full search per template (see find_elements).  With
+    *grayscale*, the screenshot is converted once and every template is
+    matched in grayscale, which is faster but can score differently from the
+    colour matching the bot uses.
+    """
     asset_dir = PROJECT_ROOT / "assets" / game
     config_dir = PROJECT_ROOT / "config" / "games"
 
@@ -690,46 +1158,63 @@ def test_assets(game: str) -> None:
         sys.exit(1)
 
     with open(config_path) as f:
-        config = yaml.safe_load(f)
+        config = _load_yaml(f)
 
-    print(f"\n{'='*60}")
+    print(f"\n{_BAR}")
     print(f"  Testing assets for: {game}")
-    print(f"{'='*60}\n")
+    print(f"{_BAR}\n")
     print("  Make sure the game is open and visible in Chrome.\n")
 
     input("  Press Enter to start test...")
     print()
 
+    from src.screen import find_elements, init_retina_scale, take_screenshot
+
     init_retina_scale()
     screenshot = take_screenshot()
 
     elements = config.get("elements", {})
-    found = 0
-    total = 0
     confidence = config.get("settings", {}).get("confidence", 0.85)
 
-    def test_element(name: str, filename: str):
-        nonlocal found, total
-        total += 1
-        filepath = asset_dir / filename
-        if not filepath.exists():
-            print(f"  [ MISSING ] {name}: file not found ({filepath})")
-            return
+    # Flatten nested element groups (e.g. bet_segments) into name -> path
+    filepaths: dict[str, Path] = {}
+    for key, value in elements.items():
+        if isinstance(value, str):
+            filepaths[key] = asset_dir / value
+        elif isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                filepaths[f"{key}.{sub_key}"] = asset_dir / sub_value
+
+    present = {name: str(path) for name, path in filepaths.items() if path.exists()}
+    if use_opencl:
+        # One full search per template on the GPU
+        matches = find_elements(
+            present, confidence, screenshot=screenshot, grayscale=grayscale,
+            use_opencl=True,
+        )
+    else:
+        # Look near where each template was captured first, then a 1/4-resolution
+        # pyramid level; misses fall back to a tiled full search that stops at the
+        # first tile with a match
+        matches = find_elements(
+            present, confidence, screenshot=screenshot, grayscale=grayscale,
+            pyramid_levels=2, search_hints=config.get("element_bboxes") or {},
+            jobs=jobs, early_exit=True,
+        )
 
-        pos = find_element(str(filepath), confidence, screenshot=screenshot)
+    found = 0
+    total = len(filepaths)
+    for name, filepath in filepaths.items():
+        if name not in present:
+            print(f"  [ MISSING ] {name}: file not found ({filepath})")
+            continue
+        pos = matches[name]
         if pos:
             print(f"  [  FOUND  ] {name} at ({pos[0]}, {pos[1]})")
             found += 1
         else:
             print(f"  [NOT FOUND] {name}")
 
-    for key, value in elements.items():
-        if isinstance(value, str):
-            test_element(key, value)
-        elif isinstance(value, dict):
-            for sub_key, sub_value in value.items():
-                test_element(f"{key}.{sub_key}", sub_value)
-
     print(f"\n  Result: {found}/{total} elements found on screen")
 
 
@@ -767,6 +1252,8 @@ class RegionSelector:
                 - category: "element" | "region" | "position"
             asset_dir: Directory to save cropped element PNGs.
         """
+        import cv2
+
         self.screenshot_2x = screenshot_2x
         self.tasks = list(tasks)
         self.asset_dir = asset_dir
@@ -774,11 +1261,13 @@ class RegionSelector:
         self.results: dict[str, dict] = {}  # name -> result data
         self.task_idx = 0
 
-        # Display at 1x logical size (half of Retina 2x)
+        from src.screen import init_retina_scale
+
+        # Display at 1x logical size (screenshot pixels / Retina scale)
+        self.scale = init_retina_scale()  # display-to-image scale factor
         h_2x, w_2x = screenshot_2x.shape[:2]
-        self.display_w = w_2x // 2
-        self.display_h = h_2x // 2
-        self.scale = 2  # display-to-image scale factor
+        self.display_w = w_2x // self.scale
+        self.display_h = h_2x // self.scale
 
         # Prepare the 1x display image
         self.base_display = cv2.resize(
@@ -802,6 +1291,8 @@ class RegionSelector:
 
     def run(self) -> dict[str, dict]:
         """Run the selector and return results when all tasks are done."""
+        import cv2
+
         cv2.namedWindow(self.WINDOW_NAME, cv2.WINDOW_AUTOSIZE)
         cv2.setMouseCallback(self.WINDOW_NAME, self._mouse_callback)
 
@@ -833,6 +1324,8 @@ class RegionSelector:
 
     def _redraw(self) -> None:
         """Redraw the display image with overlays and prompt text."""
+        import cv2
+
         display = self.base_display.copy()
 
         # Draw all committed overlays
@@ -846,10 +1339,9 @@ class RegionSelector:
 
         # Draw in-progress rectangle
         if self._drawing:
-            x1 = min(self._start_x, self._current_x)
-            y1 = min(self._start_y, self._current_y)
-            x2 = max(self._start_x, self._current_x)
-            y2 = max(self._start_y, self._current_y)
+            x1, y1, x2, y2 = _corners_to_box(
+                self._start_x, self._start_y, self._current_x, self._current_y,
+            )
             cv2.rectangle(display, (x1, y1), (x2, y2), (0, 255, 0), 2)
 
         # Draw prompt bar at the top
@@ -921,6 +1413,8 @@ class RegionSelector:
     # ── Mouse callback ───────────────────────────────────────────────────
 
     def _mouse_callback(self, event, x, y, flags, param) -> None:
+        import cv2
+
         task = self._current_task()
         if task is None:
             return
@@ -953,27 +1447,29 @@ class RegionSelector:
         elif event == cv2.EVENT_LBUTTONUP and self._drawing:
             self._drawing = False
             self._ocr_preview_text = None  # clear previous OCR preview
-            x1 = min(self._start_x, x)
-            y1 = min(self._start_y, y)
-            x2 = max(self._start_x, x)
-            y2 = max(self._start_y, y)
+            x1, y1, x2, y2 = _corners_to_box(self._start_x, self._start_y, x, y)
 
             # Reject tiny selections
             if (x2 - x1) < 4 or (y2 - y1) < 4:
                 self._redraw()
                 return
 
-            # Crop from the full-res 2x image
+            # Crop from the full-res 2x image (a view — nothing is copied
+            # until the crop is encoded or preprocessed)
             s = self.scale
             crop = self.screenshot_2x[y1 * s : y2 * s, x1 * s : x2 * s]
 
             if task["category"] == "element":
                 filename = f"{task['name']}.png"
                 filepath = self.asset_dir / filename
-                cv2.imwrite(str(filepath), crop)
+                _save_png(filepath, crop)
                 self.results[task["name"]] = {
                     "category": "element",
                     "filename": filename,
+                    "x": x1,
+                    "y": y1,
+                    "w": x2 - x1,
+                    "h": y2 - y1,
                 }
             elif task["category"] == "region":
                 self.results[task["name"]] = {
@@ -1021,6 +1517,8 @@ class RegionSelector:
             True if the user confirmed (should exit).
             False if the user pressed undo (caller should continue the loop).
         """
+        import cv2
+
         while True:
             key = cv2.waitKey(30) & 0xFF
             if key == ord("u"):
@@ -1043,18 +1541,6 @@ def _build_task_list(
     """
     defs = GAME_DEFS[game]
 
-    # Build description lookups
-    elem_desc: dict[str, str] = {}
-    for name, desc, *_ in defs["elements"]:
-        elem_desc[name] = desc
-    for name, desc in defs["optional_elements"]:
-        elem_desc[name] = desc
-    for name, desc in COMMON_OPTIONAL_ELEMENTS:
-        elem_desc[name] = desc
-
-    region_desc = {name: desc for name, desc in defs["regions"]}
-    position_desc = {name: desc for name, desc in defs["positions"]}
-
     tasks: list[dict] = []
 
     # Elements
@@ -1081,6 +1567,16 @@ def _build_task_list(
     return tasks
 
 
+def _group_asset_names(group: dict) -> Iterator[str]:
+    """Iterate over every asset name in a state group, without building lists."""
+    return itertools.chain(
+        group.get("elements", []),
+        group.get("optional_elements", []),
+        group.get("regions", []),
+        group.get("positions", []),
+    )
+
+
 def _collect_snapshots(
     game: str,
     state_groups: list[dict],
@@ -1099,38 +1595,28 @@ def _collect_snapshots(
     Returns:
         Dict mapping state name -> 2x Retina screenshot (BGR numpy array).
     """
+    from src.screen import take_screenshot
+
     # Filter to only states that contain needed assets
     if needed_names is not None:
-        filtered = []
-        for group in state_groups:
-            all_names = (
-                group.get("elements", [])
-                + group.get("optional_elements", [])
-                + group.get("regions", [])
-                + group.get("positions", [])
-            )
-            if any(n in needed_names for n in all_names):
-                filtered.append(group)
-        state_groups = filtered
+        state_groups = [
+            group for group in state_groups
+            if not needed_names.isdisjoint(_group_asset_names(group))
+        ]
 
     if not state_groups:
         return {}
 
-    print(f"\n{'='*60}")
+    print(f"\n{_BAR}")
     print(f"  Snapshot mode for: {game}")
-    print(f"{'='*60}")
+    print(f"{_BAR}")
     print()
     print("  You need screenshots from these game states:")
     for i, group in enumerate(state_groups, 1):
-        all_names = (
-            group.get("elements", [])
-            + group.get("optional_elements", [])
-            + group.get("regions", [])
-            + group.get("positions", [])
-        )
+        all_names = _group_asset_names(group)
         # Filter to only needed names if applicable
         if needed_names is not None:
-            all_names = [n for n in all_names if n in needed_names]
+            all_names = (n for n in all_names if n in needed_names)
         names_str = ", ".join(all_names)
         print(f"    {i}. {group['state']}  — {names_str}")
     print()
@@ -1154,7 +1640,7 @@ def _collect_snapshots(
         snapshot_dir.mkdir(parents=True, exist_ok=True)
         safe_name = state_name.lower().replace(" ", "_")
         snapshot_path = snapshot_dir / f"_snapshot_{safe_name}.png"
-        cv2.imwrite(str(snapshot_path), screenshot)
+        _save_png(snapshot_path, screenshot)
 
         print(f"    Screenshot captured for: {state_name}")
         print(f"    Saved snapshot: {snapshot_path}")
@@ -1177,18 +1663,10 @@ def _tasks_for_state(
         state_group: One entry from GAME_STATE_GROUPS.
         selected_names: If provided, only include tasks whose name is in the set.
     """
-    defs = GAME_DEFS[game]
-
-    # Build description lookups
-    elem_desc: dict[str, str] = {}
-    for name, desc, *_ in defs["elements"]:
-        elem_desc[name] = desc
-    for name, desc in defs["optional_elements"]:
-        elem_desc[name] = desc
-    for name, desc in COMMON_OPTIONAL_ELEMENTS:
-        elem_desc[name] = desc
-    region_desc = {name: desc for name, desc in defs["regions"]}
-    position_desc = {name: desc for name, desc in defs["positions"]}
+    desc_maps = _DESC_MAPS[game]
+    elem_desc = desc_maps["elements"]
+    region_desc = desc_maps["regions"]
+    position_desc = desc_maps["positions"]
 
     tasks: list[dict] = []
 
@@ -1239,6 +1717,7 @@ def snapshot_capture(game: str) -> dict:
 
     # Phase 2: Open RegionSelector for each state's screenshot
     captured_elements: dict[str, str] = {}
+    captured_bboxes: dict[str, dict] = {}
     captured_regions: dict[str, dict] = {}
     captured_positions: dict[str, dict] = {}
 
@@ -1263,6 +1742,7 @@ def snapshot_capture(game: str) -> dict:
         for name, data in results.items():
             if data["category"] == "element":
                 captured_elements[name] = data["filename"]
+                captured_bboxes[name] = {k: data[k] for k in ("x", "y", "w", "h")}
             elif data["category"] == "region":
                 captured_regions[name] = {
                     "x": data["x"],
@@ -1278,6 +1758,7 @@ def snapshot_capture(game: str) -> dict:
 
     return {
         "elements": captured_elements,
+        "element_bboxes": captured_bboxes,
         "regions": captured_regions,
         "positions": captured_positions,
         "asset_dir": f"assets/{game}/",
@@ -1317,6 +1798,7 @@ def snapshot_capture_selected(
 
     # Phase 2: Open RegionSelector for each state's screenshot
     captured_elements: dict[str, str] = {}
+    captured_bboxes: dict[str, dict] = {}
     captured_regions: dict[str, dict] = {}
     captured_positions: dict[str, dict] = {}
 
@@ -1341,6 +1823,7 @@ def snapshot_capture_selected(
         for name, data in results.items():
             if data["category"] == "element":
                 captured_elements[name] = data["filename"]
+                captured_bboxes[name] = {k: data[k] for k in ("x", "y", "w", "h")}
             elif data["category"] == "region":
                 captured_regions[name] = {
                     "x": data["x"],
@@ -1356,6 +1839,7 @@ def snapshot_capture_selected(
 
     return {
         "elements": captured_elements,
+        "element_bboxes": captured_bboxes,
         "regions": captured_regions,
         "positions": captured_positions,
         "asset_dir": f"assets/{game}/",
@@ -1369,6 +1853,8 @@ def redraw_regions(game: str) -> None:
     opens the RegionSelector for region-only tasks, and patches the existing
     YAML config with the new coordinates.
     """
+    import cv2
+
     config_path = PROJECT_ROOT / "config" / "games" / f"{game}.yaml"
     if not config_path.exists():
         print(f"\n  Config not found: {config_path}")
@@ -1414,9 +1900,9 @@ def redraw_regions(game: str) -> None:
         print("\n  No states with regions found. Nothing to redraw.")
         return
 
-    print(f"\n{'='*60}")
+    print(f"\n{_BAR}")
     print(f"  Redrawing regions for: {game}")
-    print(f"{'='*60}")
+    print(f"{_BAR}")
     print()
 
     # Phase 2: Open RegionSelector for each state, region tasks only
@@ -1457,14 +1943,13 @@ def redraw_regions(game: str) -> None:
 
     # Patch the existing YAML — only update the regions section
     with open(config_path) as f:
-        config = yaml.safe_load(f)
+        config = _load_yaml(f)
 
     existing_regions = config.get("regions", {})
     existing_regions.update(new_regions)
     config["regions"] = existing_regions
 
-    with open(config_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+    _write_yaml(config_path, config)
 
     print(f"\n  Updated regions in: {config_path}")
     for name, coords in new_regions.items():
@@ -1483,6 +1968,8 @@ VIM_NAV_KEYBINDINGS = {
 
 def interactive_select_game() -> str:
     """Arrow-key menu to select a game. First step — no back option."""
+    from InquirerPy import inquirer
+
     choices = [
         {"name": gt, "value": gt}
         for gt in KNOWN_GAMES
@@ -1494,13 +1981,11 @@ def interactive_select_game() -> str:
     ).execute()
 
 
-def interactive_select_assets(game: str) -> list[tuple[str, str]]:
-    """
-    Arrow-key checkbox to select which assets to capture.
+@functools.lru_cache(maxsize=None)
+def _asset_choices(game: str) -> tuple:
+    """Build (once per game) the checkbox choices for interactive_select_assets()."""
+    from InquirerPy.separator import Separator
 
-    Returns a list of (category, name) tuples where category is one of:
-    'element', 'region', 'position'.
-    """
     defs = GAME_DEFS[game]
     choices = []
 
@@ -1545,15 +2030,62 @@ def interactive_select_assets(game: str) -> list[tuple[str, str]]:
                 "enabled": True,
             })
 
+    return tuple(choices)
+
+
+def interactive_select_assets(game: str) -> list[tuple[str, str]]:
+    """
+    Arrow-key checkbox to select which assets to capture.
+
+    Returns a list of (category, name) tuples where category is one of:
+    'element', 'region', 'position'.
+    """
+    from InquirerPy import inquirer
+
     return inquirer.checkbox(
         message="Select assets to capture (Space to toggle, Enter to confirm):",
-        choices=choices,
+        choices=list(_asset_choices(game)),
         keybindings=VIM_NAV_KEYBINDINGS,
         validate=lambda res: len(res) > 0,
         invalid_message="You must select at least one asset.",
     ).execute()
 
 
+@functools.lru_cache(maxsize=None)
+def _update_choices(game: str, element_names: tuple[str, ...]) -> tuple:
+    """
+    Build the checkbox choices for interactive_select_update_assets().
+
+    Cached per (game, captured element names) so repeated update runs skip
+    rebuilding the description lookup and labels.
+    """
+    from InquirerPy.separator import Separator
+
+    # All known asset descriptions for this game
+    if game in _DESC_MAPS:
+        desc_map = _DESC_MAPS[game]["elements"]
+    else:
+        desc_map = dict(COMMON_OPTIONAL_ELEMENTS)
+
+    choices = []
+    for elem_name in element_names:
+        desc = desc_map.get(elem_name, "")
+        label = f"{elem_name} — {desc}" if desc else elem_name
+        choices.append({"name": label, "value": elem_name})
+
+    # Also offer assets that exist for this game but aren't captured yet
+    all_possible = set(desc_map.keys())
+    uncaptured = all_possible - set(element_names)
+    if uncaptured:
+        choices.append(Separator("── Not yet captured ──"))
+        for name in sorted(uncaptured):
+            desc = desc_map.get(name, "")
+            label = f"{name} — {desc}" if desc else name
+            choices.append({"name": label, "value": name})
+
+    return tuple(choices)
+
+
 def interactive_select_update_assets(game: str) -> list[str]:
     """
     Arrow-key checkbox to select which existing assets to re-capture.
@@ -1561,6 +2093,8 @@ def interactive_select_update_assets(game: str) -> list[str]:
     Reads the game's config to find all current elements and presents
     them as a selectable list.
     """
+    from InquirerPy import inquirer
+
     config_path = PROJECT_ROOT / "config" / "games" / f"{game}.yaml"
     if not config_path.exists():
         print(f"Config not found: {config_path}")
@@ -1568,18 +2102,7 @@ def interactive_select_update_assets(game: str) -> list[str]:
         sys.exit(1)
 
     with open(config_path) as f:
-        config = yaml.safe_load(f)
-
-    defs = GAME_DEFS.get(game, {})
-
-    # Build a lookup of all known asset descriptions for this game
-    desc_map = {}
-    for name, desc, *_ in defs.get("elements", []):
-        desc_map[name] = desc
-    for name, desc in defs.get("optional_elements", []):
-        desc_map[name] = desc
-    for name, desc in COMMON_OPTIONAL_ELEMENTS:
-        desc_map[name] = desc
+        config = _load_yaml(f)
 
     # Existing elements from config
     elements = config.get("elements", {})
@@ -1587,25 +2110,9 @@ def interactive_select_update_assets(game: str) -> list[str]:
         print(f"No elements found in config for '{game}'.")
         sys.exit(1)
 
-    choices = []
-    for elem_name in elements:
-        desc = desc_map.get(elem_name, "")
-        label = f"{elem_name} — {desc}" if desc else elem_name
-        choices.append({"name": label, "value": elem_name})
-
-    # Also offer assets that exist for this game but aren't captured yet
-    all_possible = set(desc_map.keys())
-    uncaptured = all_possible - set(elements.keys())
-    if uncaptured:
-        choices.append(Separator("── Not yet captured ──"))
-        for name in sorted(uncaptured):
-            desc = desc_map.get(name, "")
-            label = f"{name} — {desc}" if desc else name
-            choices.append({"name": label, "value": name})
-
     selected = inquirer.checkbox(
         message="Select assets to re-capture (Space to toggle, Enter to confirm):",
-        choices=choices,
+        choices=list(_update_choices(game, tuple(elements))),
         keybindings=VIM_NAV_KEYBINDINGS,
         validate=lambda result: len(result) > 0,
         invalid_message="You must select at least one asset.",
@@ -1614,6 +2121,26 @@ def interactive_select_update_assets(game: str) -> list[str]:
     return selected
 
 
+def _capture_phase(
+    title: str,
+    names: list[str],
+    desc_map: dict[str, str],
+    capture_one,
+    intro: str = "",
+) -> None:
+    """
+    Run one capture step: print its header, then capture_one(name, description)
+    for each name.  Does nothing when *names* is empty.
+
+    The header (and optional *intro* line) goes out as a single write.
+    """
+    if not names:
+        return
+    sys.stdout.write(f"\n--- {title} ({len(names)}) ---\n\n{intro}" + ("\n" if intro else ""))
+    for name in names:
+        capture_one(name, desc_map.get(name, ""))
+
+
 def capture_selected_elements(
     game: str,
     selected_assets: list[tuple[str, str]],
@@ -1631,21 +2158,13 @@ def capture_selected_elements(
     asset_dir = PROJECT_ROOT / "assets" / game
     asset_dir.mkdir(parents=True, exist_ok=True)
 
-    defs = GAME_DEFS[game]
-
-    # Build lookup maps for descriptions
-    elem_desc = {}
-    for name, desc, *_ in defs["elements"]:
-        elem_desc[name] = desc
-    for name, desc in defs["optional_elements"]:
-        elem_desc[name] = desc
-    for name, desc in COMMON_OPTIONAL_ELEMENTS:
-        elem_desc[name] = desc
-
-    region_desc = {name: desc for name, desc in defs["regions"]}
-    position_desc = {name: desc for name, desc in defs["positions"]}
+    desc_maps = _DESC_MAPS[game]
+    elem_desc = desc_maps["elements"]
+    region_desc = desc_maps["regions"]
+    position_desc = desc_maps["positions"]
 
     captured_elements = {}
+    captured_bboxes = {}
     captured_regions = {}
     captured_positions = {}
 
@@ -1654,73 +2173,73 @@ def capture_selected_elements(
     sel_regions = [name for cat, name in selected_assets if cat == "region"]
     sel_positions = [name for cat, name in selected_assets if cat == "position"]
 
-    print(f"\n{'='*60}")
+    print(f"\n{_BAR}")
     print(f"  Capturing assets for: {game}")
     print(f"  Asset directory: {asset_dir}")
-    print(f"{'='*60}")
+    print(f"{_BAR}")
     print()
     print("  Make sure the game is open and visible in Chrome.")
     print()
 
     # ── Capture template elements ──
-    if sel_elements:
-        print(f"--- Template Elements ({len(sel_elements)}) ---\n")
-        for elem_name in sel_elements:
-            desc = elem_desc.get(elem_name, "")
+    # Last grab of any element or region, reusable on request with 's'
+    shots: dict = {}
+    # PNGs encode on a worker thread while the next element is selected
+    with AssetWriter() as writer:
+
+        def capture_element(elem_name: str, desc: str) -> None:
             print(f"  [{elem_name}] {desc}")
-            result = capture_screenshot_region()
-            if result is None:
-                print("    Failed — try again")
-                result = capture_screenshot_region()
+            result = _capture_region_with_retry(shots)
             if result is None:
                 print("    Skipped.\n")
-                continue
+                return
 
             img, region = result
             filename = f"{elem_name}.png"
             filepath = asset_dir / filename
-            cv2.imwrite(str(filepath), img)
+            writer.enqueue(filepath, img)
             captured_elements[elem_name] = filename
-            print(f"    Saved: {filepath}\n")
+            captured_bboxes[elem_name] = region
+            print(f"    Queued: {filepath}\n")
+
+        _capture_phase("Template Elements", sel_elements, elem_desc, capture_element)
 
     # ── Capture OCR regions ──
-    if sel_regions:
-        print(f"\n--- OCR Regions ({len(sel_regions)}) ---\n")
-        print("  For each region, select the area containing the number to read.\n")
-        for region_name in sel_regions:
-            desc = region_desc.get(region_name, "")
-            print(f"  [{region_name}] {desc}")
-            result = capture_screenshot_region()
-            if result is None:
-                print("    Failed — try again")
-                result = capture_screenshot_region()
-            if result is None:
-                print("    Skipped.\n")
-                continue
+    def capture_region(region_name: str, desc: str) -> None:
+        print(f"  [{region_name}] {desc}")
+        result = _capture_region_with_retry(shots)
+        if result is None:
+            print("    Skipped.\n")
+            return
 
-            img, region = result
-            captured_regions[region_name] = region
-            print(f"    Region: x={region['x']}, y={region['y']}, "
-                  f"w={region['w']}, h={region['h']}")
-            # Show OCR preview
-            try:
-                preview = _ocr_preview(img)
-                print(f'    OCR preview: "{preview}"')
-            except Exception:
-                print("    OCR preview: <failed>")
-            print()
+        img, region = result
+        captured_regions[region_name] = region
+        print(f"    Region: x={region['x']}, y={region['y']}, "
+              f"w={region['w']}, h={region['h']}")
+        # Show OCR preview
+        try:
+            preview = _ocr_preview(img)
+            print(f'    OCR preview: "{preview}"')
+        except Exception:
+            print("    OCR preview: <failed>")
+        print()
+
+    _capture_phase(
+        "OCR Regions", sel_regions, region_desc, capture_region,
+        intro="  For each region, select the area containing the number to read.\n",
+    )
 
     # ── Capture click positions ──
-    if sel_positions:
-        print(f"\n--- Click Positions ({len(sel_positions)}) ---\n")
-        for pos_name in sel_positions:
-            desc = position_desc.get(pos_name, "")
-            pos = capture_position(f"[{pos_name}] {desc} — hover and press Enter")
-            captured_positions[pos_name] = {"x": pos[0], "y": pos[1]}
-            print()
+    def capture_click(pos_name: str, desc: str) -> None:
+        pos = capture_position(f"[{pos_name}] {desc} — hover and press Enter")
+        captured_positions[pos_name] = {"x": pos[0], "y": pos[1]}
+        print()
+
+    _capture_phase("Click Positions", sel_positions, position_desc, capture_click)
 
     return {
         "elements": captured_elements,
+        "element_bboxes": captured_bboxes,
         "regions": captured_regions,
         "positions": captured_positions,
         "asset_dir": f"assets/{game}/",
@@ -1729,6 +2248,8 @@ def capture_selected_elements(
 
 def interactive_main() -> None:
     """Top-level interactive menu when no CLI flags are provided."""
+    from InquirerPy import inquirer
+
     action = inquirer.select(
         message="What would you like to do?",
         choices=[
@@ -1750,6 +2271,8 @@ def interactive_main() -> None:
 
 def interactive_redraw_regions() -> None:
     """Interactive flow: select a game and redraw OCR regions from saved screenshots."""
+    from src.screen import init_retina_scale
+
     game = interactive_select_game()
     init_retina_scale()
     redraw_regions(game)
@@ -1765,6 +2288,8 @@ def interactive_new_game() -> None:
       3. Choose capture method (live vs snapshot, for live-dealer games)
       4. Capture and generate config
     """
+    from InquirerPy import inquirer
+
     game = interactive_select_game()
     selected_assets = interactive_select_assets(game)
 
@@ -1788,6 +2313,8 @@ def interactive_new_game() -> None:
     else:
         method = "live"
 
+    from src.screen import init_retina_scale
+
     init_retina_scale()
 
     if method == "snapshot":
@@ -1797,25 +2324,46 @@ def interactive_new_game() -> None:
 
     config_path = generate_yaml_config(game, captured)
 
-    print(f"\n{'='*60}")
-    print(f"  Done! Next steps:")
-    print(f"  1. Review config: {config_path}")
-    print(f"  2. Test: python3 tools/capture.py --game {game} --test")
-    print(f"  3. Run: python3 main.py --config {config_path} --duration 60")
-    print(f"{'='*60}\n")
+    _print_done_banner(config_path, game)
 
 
-def interactive_update_game(game: str) -> None:
-    """Interactive flow: select which assets to re-capture for an existing game."""
+def interactive_update_game(game: str, jobs: int = 4) -> None:
+    """
+    Interactive flow: select which assets to re-capture for an existing game.
+
+    Captures run one after another (each needs the user), while up to *jobs*
+    worker threads encode the PNGs in the background.  The game's YAML is
+    loaded once and rewritten once for the whole batch.
+    """
+    from src.screen import init_retina_scale
+
     selected = interactive_select_update_assets(game)
+    if not selected:
+        return
 
     init_retina_scale()
 
-    for element_name in selected:
-        update_single_asset(game, element_name)
+    config_path = PROJECT_ROOT / "config" / "games" / f"{game}.yaml"
+    with open(config_path) as f:
+        config = _load_yaml(f)
+
+    # Encodes run on the writer's threads; files are written together on exit.
+    # The config is saved even if the batch is cancelled part-way, so it
+    # matches the assets that were written.
+    try:
+        with AssetWriter(jobs=min(jobs, len(selected))) as writer:
+            for element_name in selected:
+                update_single_asset(game, element_name, writer=writer, config=config)
+    finally:
+        _write_yaml(config_path, config)
+        print(f"\n  Config updated: {config_path}")
 
+    print(f"\n  Done! Test with: python3 tools/capture.py --game {game} --test\n")
 
-def main():
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="Capture game assets and generate YAML configs"
     )
@@ -1859,8 +2407,115 @@ def main():
         help="Re-draw OCR regions on existing screenshots without taking new ones. "
              "Requires --game and a prior --snapshot run.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="Worker threads for writing re-captured assets with "
+             "--update-asset and for matching templates with --test "
+             "(default: 4)",
+    )
+    parser.add_argument(
+        "--force-regen",
+        action="store_true",
+        help="Always rewrite the YAML config, even if the captured assets "
+             "match the last generated config",
+    )
+    parser.add_argument(
+        "--png-level",
+        type=int,
+        choices=range(10),
+        default=None,
+        metavar="0-9",
+        help="zlib compression level for saved template PNGs; 0 stores "
+             "uncompressed for the fastest saves. Without this flag the fpnge "
+             "encoder is used if installed, else level 1",
+    )
+    parser.add_argument(
+        "--opencl",
+        action="store_true",
+        help="With --test, run template matching through OpenCL (GPU) when "
+             "OpenCV has it available",
+    )
+    parser.add_argument(
+        "--grayscale",
+        action="store_true",
+        help="With --test, match templates in grayscale for a faster check "
+             "(scores may differ slightly from the bot's colour matching)",
+    )
+
+    return parser
+
+
+# ── CLI command handlers ─────────────────────────────────────────────────
+# Each takes the parsed args for a run with --game set.
+
+
+def _cmd_redraw_regions(args: argparse.Namespace) -> None:
+    redraw_regions(args.game)
+
+
+def _cmd_update_asset(args: argparse.Namespace) -> None:
+    if args.update_asset == "__interactive__":
+        interactive_update_game(args.game, jobs=args.jobs)
+    else:
+        update_single_asset(args.game, args.update_asset)
+
+
+def _cmd_reset(args: argparse.Namespace) -> None:
+    reset_game(args.game)
+    captured = capture_elements(args.game)
+    config_path = generate_yaml_config(args.game, captured, force=args.force_regen)
+    print(f"\n{_BAR}")
+    print(f"  Re-captured! Config: {config_path}")
+    print(f"  Run: python3 main.py --config {config_path} --duration 60")
+    print(f"{_BAR}\n")
+
+
+def _cmd_test(args: argparse.Namespace) -> None:
+    test_assets(
+        args.game, use_opencl=args.opencl, jobs=args.jobs, grayscale=args.grayscale,
+    )
+
+
+def _cmd_capture(args: argparse.Namespace) -> None:
+    if args.snapshot:
+        captured = snapshot_capture(args.game)
+    else:
+        captured = capture_elements(args.game)
+    config_path = generate_yaml_config(args.game, captured, force=args.force_regen)
+
+    _print_done_banner(config_path, args.game)
+
+
+# Mode flags in precedence order; a run with none of them set captures
+_COMMANDS = (
+    ("redraw_regions", _cmd_redraw_regions),
+    ("update_asset", _cmd_update_asset),
+    ("reset", _cmd_reset),
+    ("test", _cmd_test),
+)
+
 
-    args = parser.parse_args()
+def _command_for(args: argparse.Namespace):
+    """Pick the handler for the first mode flag set on *args*."""
+    for flag, handler in _COMMANDS:
+        if getattr(args, flag):
+            return handler
+    return _cmd_capture
+
+
+def main():
+    # Fast path: `--help-game GAME` is read-only, so answer it before any
+    # argparse work (the parser below still handles `--help-game=GAME`)
+    if len(sys.argv) >= 3 and sys.argv[1] == "--help-game":
+        print_game_help(sys.argv[2])
+        sys.exit(0)
+
+    args = _build_parser().parse_args()
+
+    global _PNG_LEVEL
+    _PNG_LEVEL = args.png_level
 
     # --help-game doesn't require --game
     if args.help_game:
@@ -1872,38 +2527,11 @@ def main():
         interactive_main()
         sys.exit(0)
 
+    from src.screen import init_retina_scale
+
     init_retina_scale()
 
-    if args.redraw_regions:
-        redraw_regions(args.game)
-    elif args.update_asset:
-        if args.update_asset == "__interactive__":
-            interactive_update_game(args.game)
-        else:
-            update_single_asset(args.game, args.update_asset)
-    elif args.reset:
-        reset_game(args.game)
-        captured = capture_elements(args.game)
-        config_path = generate_yaml_config(args.game, captured)
-        print(f"\n{'='*60}")
-        print(f"  Re-captured! Config: {config_path}")
-        print(f"  Run: python3 main.py --config {config_path} --duration 60")
-        print(f"{'='*60}\n")
-    elif args.test:
-        test_assets(args.game)
-    else:
-        if args.snapshot:
-            captured = snapshot_capture(args.game)
-        else:
-            captured = capture_elements(args.game)
-        config_path = generate_yaml_config(args.game, captured)
-
-        print(f"\n{'='*60}")
-        print(f"  Done! Next steps:")
-        print(f"  1. Review config: {config_path}")
-        print(f"  2. Test: python3 tools/capture.py --game {args.game} --test")
-        print(f"  3. Run: python3 main.py --config {config_path} --duration 60")
-        print(f"{'='*60}\n")
+    _command_for(args)(args)
 
 
 if __name__ == "__main__":